@@ -41,6 +41,9 @@ class InformantConfig(metaclass=Singleton):
                 'BOLD': '\033[1m'
         }
         self.readlist = None
+        self.readset = None
+        self.readlist_unsaved = [] # keys marked as read since the last save
+        self.readlist_rewrite = False # datfile needs to be rewritten in full
         self.debug_print = None
 
     def set_argv(self, args):
@@ -85,6 +88,11 @@ class InformantConfig(metaclass=Singleton):
             return self.argv.get(FILE_OPT)
         return FILE_DEFAULT
 
+    def set_readlist(self, readlist):
+        """ Store the readlist along with a set of its keys for fast lookups """
+        self.readlist = readlist
+        self.readset = set(readlist)
+
     def set_config(self, config):
         self.config = config
 
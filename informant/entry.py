@@ -8,29 +8,24 @@ from informant.config import InformantConfig
 import informant.ui as ui
 
 class Entry:
+    __slots__ = ('title', 'timestamp', 'pretty_date', 'body', 'feed_name', 'read_key')
+
     def __init__(self, title, timestamp, body, feed_name):
         self.title = title
         self.timestamp = timestamp
         self.pretty_date = timestamp.strftime('%a, %d %b %Y %H:%M:%S %z')
         self.body = body
         self.feed_name = feed_name
+        self.read_key = str(timestamp.timestamp()) + '|' + title # readlist key
 
     def has_been_read(self):
         """ Check if this entry has been read and return True or False. """
-        readlist = InformantConfig().readlist
-        #ui.debug_print('readlist: {}'.format(readlist))
-        title = self.title
-        date = self.timestamp
-        if str(date.timestamp()) + '|' + title in readlist:
-            return True
-        return False
+        return self.read_key in InformantConfig().readset
 
     def mark_as_read(self):
         """ Save this entry to mark it as read. """
-        readlist = InformantConfig().readlist
         if self.has_been_read():
             return
-        title = self.title
-        date = self.timestamp
-        readlist.append(str(date.timestamp()) + '|' + title)
-
+        InformantConfig().readlist.append(self.read_key)
+        InformantConfig().readset.add(self.read_key)
+        InformantConfig().readlist_unsaved.append(self.read_key)
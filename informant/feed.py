@@ -16,7 +16,6 @@ from urllib.error import URLError
 
 from informant.config import InformantConfig
 from informant.entry import Entry
-import informant.file as fs
 import informant.ui as ui
 
 ARCH_NEWS = 'https://archlinux.org/feeds/news/'
@@ -70,9 +69,6 @@ class Feed:
     def fetch(self):
         # TODO: update to check for http 301/302 redirects
         feed = None
-        if InformantConfig().get_argv_clear_cache():
-            ui.debug_print('Clearing cache')
-            fs.clear_cachefile()
         if InformantConfig().get_argv_use_cache():
             ui.debug_print('Checking cache in {}'.format(InformantConfig().get_cachefile()))
             cachefile = InformantConfig().get_cachefile()
@@ -5,48 +5,85 @@ This module contains filesystem related functions.
 """
 
 import glob
+import json
 import os
-import pickle
 import shutil
 import sys
 
 from informant.config import InformantConfig
 import informant.ui as ui
 
+BUFFER_SIZE = 1 << 20 # 1 MiB buffer for datfile reads/writes
+PICKLE_MAGIC = b'\x80' # first byte of pickle protocol 2+ data
+
 def read_datfile():
-    """ Return the saved readlist from the datfile """
+    """ Return the saved readlist from the datfile.
+    The datfile is a text file with one JSON encoded readlist key per line, the
+    encoding keeps keys whose titles contain line breaks intact. Save data
+    from informant <= 0.5.0 is a pickle, if found it is loaded and flagged to
+    be rewritten as text on the next save.
+    """
     filename = InformantConfig().get_savefile()
     ui.debug_print('Getting datfile from "{}"'.format(filename))
     if InformantConfig().get_argv_clear_savefile():
         ui.debug_print('Clear savefile specified returning empty list')
         return []
     try:
-        with open(filename, 'rb') as pickle_file:
-            try:
-                readlist = pickle.load(pickle_file)
-                pickle_file.close()
-                if isinstance(readlist, tuple):
-                    # backwards compatibility with informant < 0.4.0 save data
-                    readlist = readlist[1]
-            except (EOFError, ValueError):
-                readlist = []
+        with open(filename, 'rb', buffering=BUFFER_SIZE) as datfile:
+            data = datfile.read()
     except (FileNotFoundError, PermissionError):
-        readlist = []
+        return []
+    if data.startswith(PICKLE_MAGIC):
+        ui.debug_print('Found pickled datfile, it will be converted on save')
+        InformantConfig().readlist_rewrite = True
+        import pickle # only needed to convert old save data
+        try:
+            readlist = pickle.loads(data)
+            if isinstance(readlist, tuple):
+                # backwards compatibility with informant < 0.4.0 save data
+                readlist = readlist[1]
+        except (EOFError, ValueError, pickle.UnpicklingError):
+            readlist = []
+        return readlist
+    try:
+        lines = data.decode('utf-8').split('\n')
+    except UnicodeDecodeError:
+        return []
+    readlist = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            readlist.append(json.loads(line))
+        except ValueError:
+            ui.debug_print('Skipping malformed datfile line: {}'.format(line))
     return readlist
 
 def save_datfile():
-    """ Save the readlist to the datfile """
+    """ Save the readlist to the datfile.
+    Newly read keys are appended to the datfile, the whole readlist is only
+    written out when the datfile is being cleared or converted.
+    """
     debug = InformantConfig().get_argv_debug()
-    readlist = InformantConfig().readlist
     if debug:
         ui.debug_print('running in debug mode, will not update readlist')
         return
+    if InformantConfig().readlist_rewrite \
+    or InformantConfig().get_argv_clear_savefile():
+        mode = 'w'
+        keys = InformantConfig().readlist
+    elif InformantConfig().readlist_unsaved:
+        mode = 'a'
+        keys = InformantConfig().readlist_unsaved
+    else:
+        ui.debug_print('readlist unchanged, skipping save')
+        return
     filename = InformantConfig().get_savefile()
     try:
-        # then open as write to save updated list
-        with open(filename, 'wb') as pickle_file:
-            pickle.dump(readlist, pickle_file)
-            pickle_file.close()
+        with open(filename, mode, buffering=BUFFER_SIZE, encoding='utf-8') as datfile:
+            datfile.write(''.join(json.dumps(key) + '\n' for key in keys))
+        InformantConfig().readlist_unsaved = []
+        InformantConfig().readlist_rewrite = False
     except PermissionError:
         ui.err_print('Unable to save read information, please re-run with \
 correct permissions to access "{}".'.format(filename))
@@ -41,7 +41,10 @@ Options:
 """
 
 # builtins
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 # external
 import docopt
@@ -67,22 +70,41 @@ UNREAD_OPT = '--unread'
 ITEM_ARG = '<item>'
 READALL_OPT = '--all'
 
+MAX_FETCH_WORKERS = 8 # upper bound on feeds fetched concurrently
+
+def fetch_feeds(feed_configs):
+    """ Fetch the given feeds concurrently and return all of their entries.
+    Entries are returned in the order of 'feed_configs'. """
+    if InformantConfig().get_argv_clear_cache():
+        # clear once up front rather than while other feeds are being cached
+        ui.debug_print('Clearing cache')
+        fs.clear_cachefile()
+    entries = []
+    if not feed_configs:
+        return entries
+    workers = min(MAX_FETCH_WORKERS, len(feed_configs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for feed_entries in executor.map(lambda cfg: Feed(cfg).entries, feed_configs):
+            entries.extend(feed_entries)
+    return entries
+
 def check_cmd(feed):
     """ Run the check command. Check if there are any news items that are
     unread. If there is only one unread item, print it out and mark it as read.
     Also, exit the program with return code matching the unread count. """
     running_from_pacman = ui.running_from_pacman()
-    unread = 0
-    unread_items = []
-    for entry in feed:
-        if not entry.has_been_read():
-            unread += 1
-            unread_items.append(entry)
+    unread_items = (entry for entry in feed if not entry.has_been_read())
+    first_unread = next(unread_items, None)
+    if first_unread is None:
+        unread = 0
+    else:
+        # only the first unread item is needed, the rest are just counted
+        unread = 1 + sum(1 for _ in unread_items)
     if unread == 1:
         if running_from_pacman:
             ui.pacman_msg('Stopping upgrade to print news')
-        ui.pretty_print_item(unread_items[0])
-        unread_items[0].mark_as_read()
+        ui.pretty_print_item(first_unread)
+        first_unread.mark_as_read()
         fs.save_datfile()
         if running_from_pacman:
             ui.pacman_msg('You can re-run your pacman command to complete the upgrade')
@@ -102,12 +124,14 @@ def list_cmd(feed):
         feed_list = reversed(feed)
     else:
         feed_list = feed
-    index = 0
+    unread_only = argv.get(UNREAD_OPT)
+    terminal_width = shutil.get_terminal_size().columns
+    lines = []
     for entry in feed_list:
-        if not argv.get(UNREAD_OPT) \
-        or (argv.get(UNREAD_OPT) and not entry.has_been_read()):
-            print(ui.format_list_item(entry, index))
-            index += 1
+        if not unread_only or not entry.has_been_read():
+            lines.append(ui.format_list_item(entry, len(lines), terminal_width))
+    # write the whole list at once rather than printing per item
+    sys.stdout.write(''.join(line + '\n' for line in lines))
 
 def read_cmd(feed):
     """ Run the read command. Print news items and mark them as read. """
@@ -128,14 +152,13 @@ def read_cmd(feed):
             ui.pretty_print_item(entry)
             entry.mark_as_read()
         else:
-            unread_entries = list()
-            for entry in feed:
-                if not entry.has_been_read():
-                    unread_entries.insert(0, entry)
-            for entry in unread_entries:
+            # oldest unread first
+            unread_entries = [entry for entry in reversed(feed) if not entry.has_been_read()]
+            last_index = len(unread_entries) - 1
+            for index, entry in enumerate(unread_entries):
                 ui.pretty_print_item(entry)
                 entry.mark_as_read()
-                if entry is not unread_entries[-1]:
+                if index != last_index:
                     read_next = ui.prompt_yes_no('Read next item?', 'yes')
                     if read_next in ('n', 'no'):
                         break
@@ -149,22 +172,20 @@ def main():
     argv = docopt.docopt(__doc__, version='informant v{}'.format(__version__))
     InformantConfig().set_argv(argv)
     InformantConfig().debug_print = ui.debug_print
-    InformantConfig().readlist = fs.read_datfile()
+    InformantConfig().set_readlist(fs.read_datfile())
     config = InformantConfig().get_config()
     ui.debug_print('cli args: {}'.format(argv))
 
     if 'feeds' in config:
-        feed = []
-        for config_feed in config['feeds']:
-            feed += Feed(config_feed).entries
+        feed = fetch_feeds(config['feeds'])
     else:
-        feed = Feed().entries
+        feed = fetch_feeds([{}])
 
     if not feed:
         ui.warn_print('no news feed items, informant is performing no action')
         sys.exit()
 
-    feed = sorted(feed, key=lambda k: k.timestamp, reverse=True)
+    feed = sorted(feed, key=attrgetter('timestamp'), reverse=True)
 
     if argv.get(CHECK_CMD):
         check_cmd(feed)
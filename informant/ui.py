@@ -5,12 +5,7 @@ This module contains User Interface related functions.
 """
 
 import os
-import shutil
-import subprocess
 import sys
-import textwrap
-
-import html2text
 
 from informant.config import InformantConfig
 
@@ -76,11 +71,28 @@ def prompt_yes_no(question, default):
 def running_from_pacman():
     """ Return True if the parent process is pacman """
     ppid = os.getppid()
-    p_name = subprocess.check_output(['ps', '-p', str(ppid), '-o', 'comm='])
-    p_name = p_name.decode().rstrip()
+    try:
+        with open('/proc/{:d}/comm'.format(ppid), 'r') as comm:
+            p_name = comm.read().rstrip()
+    except OSError:
+        # no procfs, fall back to asking ps
+        import subprocess
+        p_name = subprocess.check_output(['ps', '-p', str(ppid), '-o', 'comm='])
+        p_name = p_name.decode().rstrip()
     debug_print('informant running from: {}'.format(p_name))
     return p_name == 'pacman'
 
+def html_to_text(html):
+    """ Convert an item's HTML body to readable text.
+    A new HTML2Text is used per call because it keeps state (such as link
+    numbering) between calls to handle().
+    """
+    import html2text # deferred so 'check' with no news doesn't pay for it
+    h2t = html2text.HTML2Text()
+    h2t.inline_links = False
+    h2t.body_width = 85
+    return h2t.handle(html)
+
 def pretty_print_item(entry):
     """ Print out the given entry, replacing some markup to make it look nicer.
     If the '--raw' option has been provided then the markup will not be
@@ -90,47 +102,67 @@ def pretty_print_item(entry):
     body = entry.body
     bold = InformantConfig().colors['BOLD']
     clear = InformantConfig().colors['CLEAR']
-    timestamp = str(entry.pretty_date)
+    timestamp = entry.pretty_date
     if not argv.get(RAW_OPT):
         #if not using raw also bold title
         title = bold + title + clear
-        h2t = html2text.HTML2Text()
-        h2t.inline_links = False
-        h2t.body_width = 85
-        body = h2t.handle(body)
+        body = html_to_text(body)
     if entry.feed_name is not None:
         feed_name = '({})'.format(entry.feed_name)
-        print('{}\n{}\n{}\n\n{}'.format(title, feed_name, timestamp, body))
+        parts = (title, '\n', feed_name, '\n', timestamp, '\n\n', body, '\n')
     else:
-        print('{}\n{}\n\n{}'.format(title, timestamp, body))
+        parts = (title, '\n', timestamp, '\n\n', body, '\n')
+    sys.stdout.write(''.join(parts))
 
-def format_list_item(entry, index):
+def wrap_text(text, width):
+    """ Split 'text' on whitespace into lines of at most 'width' characters,
+    breaking words that are longer than a line. This is all list headings need
+    and avoids the overhead of textwrap. Always returns at least one line.
+    """
+    width = max(width, 1)
+    lines = []
+    line = ''
+    for word in text.split():
+        if line and len(line) + 1 + len(word) <= width:
+            line += ' ' + word
+            continue
+        if line:
+            lines.append(line)
+        while len(word) > width:
+            lines.append(word[:width])
+            word = word[width:]
+        line = word
+    if line or not lines:
+        lines.append(line)
+    return lines
+
+def format_list_item(entry, index, terminal_width):
     """ Returns a formatted string with the entry's index number, title, and
-    right-aligned timestamp. Unread items are bolded"""
+    right-aligned timestamp fitted to 'terminal_width'. Unread items are
+    bolded"""
     bold = InformantConfig().colors['BOLD']
     clear = InformantConfig().colors['CLEAR']
-    terminal_width = shutil.get_terminal_size().columns
-    timestamp = str(entry.pretty_date)
+    timestamp = entry.pretty_date
     wrap_width = terminal_width - len(timestamp) - 1
     heading = str(index) + ': ' + entry.title
-    wrapped_heading = textwrap.wrap(heading, wrap_width)
+    wrapped_heading = wrap_text(heading, wrap_width)
     padding = terminal_width - len(wrapped_heading[0] + timestamp)
     if entry.has_been_read():
-        return (
-            wrapped_heading[0] +
-            ' ' * (padding) +
-            timestamp +
+        parts = (
+            wrapped_heading[0],
+            ' ' * padding,
+            timestamp,
             '\n'.join(wrapped_heading[1:])
-                )
+        )
     else:
-        return (
-            bold +
-            wrapped_heading[0] +
-            clear +
-            ' ' * (padding) +
-            timestamp +
-            bold +
-            '\n'.join(wrapped_heading[1:]) +
+        parts = (
+            bold,
+            wrapped_heading[0],
+            clear,
+            ' ' * padding,
+            timestamp,
+            bold,
+            '\n'.join(wrapped_heading[1:]),
             clear
         )
-
+    return ''.join(parts)